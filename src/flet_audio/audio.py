@@ -1,4 +1,6 @@
-from typing import Optional
+import asyncio
+from base64 import b64decode
+from dataclasses import field
 
 import flet as ft
 
@@ -9,6 +11,35 @@ from flet_audio.types import (
     ReleaseMode,
 )
 
+# shared arguments for the common "play/seek from the start" case;
+# never mutated, as `_invoke_method` only serializes them
+_START_POSITION_ARGUMENTS = {"position": 0}
+
+# the client reports a position change about every second of playback;
+# a dropped position change is delivered only after a longer silence,
+# i.e. once playback has paused, stopped or completed
+_TRAILING_POSITION_CHANGE_DELAY = 1.5
+
+
+def _position_arguments(position: ft.DurationValue) -> dict:
+    """
+    Returns the `play`/`seek` method arguments for the given `position`.
+    """
+    return _START_POSITION_ARGUMENTS if position == 0 else {"position": position}
+
+
+def _resolve(future: asyncio.Future, error: Exception | None = None):
+    """
+    Completes `future` with `error`, or with `None` if not given,
+    unless its waiter has already given up on it.
+    """
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
 
 @ft.control("Audio")
 class Audio(ft.Service):
@@ -16,7 +47,8 @@ class Audio(ft.Service):
     A control to simultaneously play multiple audio sources.
 
     Raises:
-        AssertionError: If both [`src`][(c).] and [`src_base64`][(c).] are `None`.
+        ValueError: If both [`src`][(c).] and [`src_base64`][(c).] are `None`,
+            or if [`src_base64`][(c).] is not a valid base-64 encoded string.
 
     Note:
         This control is non-visual and should be added to
@@ -24,7 +56,7 @@ class Audio(ft.Service):
         list before it can be used.
     """
 
-    src: Optional[str] = None
+    src: str | None = None
     """
     The audio source.
     Can be a URL or a local [asset file](https://docs.flet.dev/cookbook/assets).
@@ -36,7 +68,7 @@ class Audio(ft.Service):
             is a list of supported audio formats.
     """
 
-    src_base64: Optional[str] = None
+    src_base64: str | None = None
     """
     Defines the contents of audio file encoded in base-64 format.
 
@@ -88,23 +120,53 @@ class Audio(ft.Service):
     Defines the release mode.
     """
 
-    on_loaded: Optional[ft.ControlEventHandler["Audio"]] = None
+    position_change_min_interval: ft.DurationValue | None = field(
+        default=None, metadata={"skip": True}
+    )
+    """
+    The minimum playback progress between two consecutive
+    [`on_position_change`][(c).] events.
+
+    An `int` value is in milliseconds.
+
+    Position changes that happen sooner are dropped and don't invoke the handler,
+    which is useful when the handler rebuilds a large part of the page.
+    The last dropped position is still delivered once playback stops reporting
+    position changes (for example, when it is paused or reaches the end).
+    The first position change after [`play()`][flet_audio.Audio.play],
+    [`seek()`][flet_audio.Audio.seek] or a source change, as well as seeking
+    backwards, always fires the event.
+
+    If `None` (the default), every position change fires the event.
+    """
+
+    seek_coalesce: bool = field(default=True, metadata={"skip": True})
+    """
+    Whether rapid [`seek()`][flet_audio.Audio.seek] calls are coalesced.
+
+    If `True`, a seek requested while a previous one is still in progress
+    (for example, while dragging a progress slider) replaces any other pending
+    seek, so only the most recent position is sent.
+    If `False`, every call is sent to the client as is.
+    """
+
+    on_loaded: ft.ControlEventHandler["Audio"] | None = None
     """
     Fires when an audio is loaded/buffered.
     """
 
-    on_duration_change: Optional[ft.EventHandler[AudioDurationChangeEvent]] = None
+    on_duration_change: ft.EventHandler[AudioDurationChangeEvent] | None = None
     """
     Fires as soon as audio duration is available
     (it might take a while to download or buffer it).
     """
 
-    on_state_change: Optional[ft.EventHandler[AudioStateChangeEvent]] = None
+    on_state_change: ft.EventHandler[AudioStateChangeEvent] | None = None
     """
     Fires when audio player state changes.
     """
 
-    on_position_change: Optional[ft.EventHandler[AudioPositionChangeEvent]] = None
+    on_position_change: ft.EventHandler[AudioPositionChangeEvent] | None = None
     """
     Fires when audio position is changed.
     Will continuously update the position of the playback
@@ -113,17 +175,107 @@ class Audio(ft.Service):
     Can be used for a progress bar.
     """
 
-    on_seek_complete: Optional[ft.ControlEventHandler["Audio"]] = None
+    on_seek_complete: ft.ControlEventHandler["Audio"] | None = None
     """
     Fires on seek completions.
     An event is going to be sent as soon as the audio seek is finished.
     """
 
+    def __post_init__(self, ref):
+        super().__post_init__(ref)
+        self.__validated_src_base64: str | None = None
+        self.__sources: tuple[str | None, str | None] | None = None
+        self.__last_position_change: int | None = None
+        self.__trailing_position_change: asyncio.TimerHandle | None = None
+        self.__position_change_dispatch: asyncio.Task | None = None
+        self.__pending_seek: (
+            tuple[ft.DurationValue, float | None, asyncio.Future] | None
+        ) = None
+        self.__seek_task: asyncio.Task | None = None
+
     def before_update(self):
-        super().before_update()
-        assert self.src or self.src_base64, "either src or src_base64 must be provided"
+        if not (self.src or self.src_base64):
+            raise ValueError("either src or src_base64 must be provided")
+        if self.src_base64 and self.src_base64 != self.__validated_src_base64:
+            # decode once per new value, so that malformed data fails here
+            # instead of on the Flutter side; like Dart's `base64Decode`,
+            # accept both the standard and the URL-safe alphabets
+            try:
+                b64decode(self.src_base64, altchars=b"-_", validate=True)
+            except ValueError as e:
+                raise ValueError(
+                    "src_base64 must be a valid base-64 encoded string"
+                ) from e
+            self.__validated_src_base64 = self.src_base64
+        if (self.src, self.src_base64) != self.__sources:
+            self.__sources = (self.src, self.src_base64)
+            self.__reset_position_change()
+
+    def before_event(self, e: ft.ControlEvent):
+        if (
+            isinstance(e, AudioPositionChangeEvent)
+            and self.position_change_min_interval is not None
+        ):
+            min_interval = self.position_change_min_interval
+            if isinstance(min_interval, ft.Duration):
+                min_interval = min_interval.in_milliseconds
+            if self.__trailing_position_change is not None:
+                # superseded by this event
+                self.__trailing_position_change.cancel()
+                self.__trailing_position_change = None
+            last = self.__last_position_change
+            if last is not None and 0 <= e.position - last < min_interval:
+                self.__trailing_position_change = asyncio.get_running_loop().call_later(
+                    _TRAILING_POSITION_CHANGE_DELAY / (self.playback_rate or 1),
+                    self.__dispatch_trailing_position_change,
+                    e.position,
+                )
+                return False
+            self.__last_position_change = e.position
+        return super().before_event(e)
+
+    def __reset_position_change(self):
+        """
+        Forgets the last delivered position and drops a pending trailing one.
+        """
+        self.__last_position_change = None
+        if self.__trailing_position_change is not None:
+            self.__trailing_position_change.cancel()
+            self.__trailing_position_change = None
+
+    def __dispatch_trailing_position_change(self, position: int):
+        """
+        Dispatches a dropped `position_change` event after playback
+        stopped reporting newer ones.
+        """
+        self.__trailing_position_change = None
+        try:
+            session = self.page.session
+        except RuntimeError:
+            return  # removed from the page in the meantime
+        self.__last_position_change = None
+        self.__position_change_dispatch = asyncio.create_task(
+            session.dispatch_event(self._i, "position_change", {"position": position})
+        )
+        self.__position_change_dispatch.add_done_callback(
+            self.__position_change_dispatched
+        )
 
-    async def play(self, position: ft.DurationValue = 0, timeout: Optional[float] = 10):
+    def __position_change_dispatched(self, task: asyncio.Task):
+        """
+        Forgets the finished trailing `position_change` dispatch.
+        """
+        if self.__position_change_dispatch is task:
+            self.__position_change_dispatch = None
+
+    def will_unmount(self):
+        super().will_unmount()
+        self.__reset_position_change()
+        if self.__position_change_dispatch is not None:
+            self.__position_change_dispatch.cancel()
+            self.__position_change_dispatch = None
+
+    async def play(self, position: ft.DurationValue = 0, timeout: float | None = 10):
         """
         Starts playing audio from the specified `position`.
 
@@ -134,13 +286,14 @@ class Audio(ft.Service):
         Raises:
             TimeoutError: If the request times out.
         """
+        self.__reset_position_change()
         await self._invoke_method(
-            method_name="play",
-            arguments={"position": position},
+            "play",
+            _position_arguments(position),
             timeout=timeout,
         )
 
-    async def pause(self, timeout: Optional[float] = 10):
+    async def pause(self, timeout: float | None = 10):
         """
         Pauses the audio that is currently playing.
 
@@ -149,7 +302,7 @@ class Audio(ft.Service):
         """
         await self._invoke_method("pause", timeout=timeout)
 
-    async def resume(self, timeout: Optional[float] = 10):
+    async def resume(self, timeout: float | None = 10):
         """
         Resumes the audio that has been paused or stopped.
 
@@ -161,7 +314,7 @@ class Audio(ft.Service):
         """
         await self._invoke_method("resume", timeout=timeout)
 
-    async def release(self, timeout: Optional[float] = 10):
+    async def release(self, timeout: float | None = 10):
         """
         Releases the resources associated with this media player.
         These are going to be fetched or buffered again as soon as
@@ -175,26 +328,66 @@ class Audio(ft.Service):
         """
         await self._invoke_method("release", timeout=timeout)
 
-    async def seek(self, position: ft.DurationValue, timeout: Optional[float] = 10):
+    async def seek(self, position: ft.DurationValue, timeout: float | None = 10):
         """
         Moves the cursor to the desired position.
 
+        If [`seek_coalesce`][(c).] is `True`, calls made while a previous seek is
+        still in progress (for example, while dragging a progress slider) are
+        coalesced: only the most recent `position` is sent. A call returns once
+        its position has been applied, or as soon as a newer call replaces it.
+
         Args:
             position: The position to seek/move to.
-            timeout: The maximum amount of time (in seconds) to wait for a response.
+            timeout: The maximum amount of time (in seconds) to wait for this
+                call to complete, including the time spent waiting for
+                a previous seek to finish.
 
         Raises:
             TimeoutError: If the request times out.
         """
-        await self._invoke_method(
-            method_name="seek",
-            arguments={"position": position},
-            timeout=timeout,
-        )
-
-    async def get_duration(
-        self, timeout: Optional[float] = 10
-    ) -> Optional[ft.Duration]:
+        self.__reset_position_change()
+        if not self.seek_coalesce:
+            await self._invoke_method(
+                "seek", _position_arguments(position), timeout=timeout
+            )
+            return
+
+        completed = asyncio.get_running_loop().create_future()
+        if self.__pending_seek is not None:
+            # not sent yet and replaced by this newer position
+            _resolve(self.__pending_seek[2])
+        self.__pending_seek = (position, timeout, completed)
+        if self.__seek_task is None or self.__seek_task.done():
+            self.__seek_task = asyncio.create_task(self.__seek_pending())
+        try:
+            await asyncio.wait_for(completed, timeout)
+        except asyncio.TimeoutError:
+            if not completed.cancelled():
+                raise  # the seek request itself timed out
+            raise TimeoutError(
+                f"Timeout waiting for seek({position}) to complete"
+            ) from None
+
+    async def __seek_pending(self):
+        """
+        Sends the latest pending seek until no newer one has been requested.
+        """
+        while self.__pending_seek is not None:
+            position, timeout, completed = self.__pending_seek
+            self.__pending_seek = None
+            try:
+                await self._invoke_method(
+                    "seek",
+                    _position_arguments(position),
+                    timeout=timeout,
+                )
+            except Exception as e:
+                _resolve(completed, e)
+            else:
+                _resolve(completed)
+
+    async def get_duration(self, timeout: float | None = 10) -> ft.Duration | None:
         """
         Get audio duration of the audio playback.
 
@@ -210,14 +403,11 @@ class Audio(ft.Service):
         Raises:
             TimeoutError: If the request times out.
         """
-        return await self._invoke_method(
-            method_name="get_duration",
-            timeout=timeout,
-        )
+        return await self._invoke_method("get_duration", timeout=timeout)
 
     async def get_current_position(
-        self, timeout: Optional[float] = 10
-    ) -> Optional[ft.Duration]:
+        self, timeout: float | None = 10
+    ) -> ft.Duration | None:
         """
         Get the current position of the audio playback.
 
@@ -227,7 +417,30 @@ class Audio(ft.Service):
         Returns:
             The current position of the audio playback.
         """
-        return await self._invoke_method(
-            method_name="get_current_position",
-            timeout=timeout,
+        return await self._invoke_method("get_current_position", timeout=timeout)
+
+    async def get_duration_and_position(
+        self, timeout: float | None = 10
+    ) -> tuple[ft.Duration | None, ft.Duration | None]:
+        """
+        Get both the duration and the current position of the audio playback.
+
+        Both values are requested concurrently, making this faster than awaiting
+        [`get_duration()`][flet_audio.Audio.get_duration] and
+        [`get_current_position()`][flet_audio.Audio.get_current_position]
+        one after the other, e.g. when polling for a progress bar.
+
+        Args:
+            timeout: The maximum amount of time (in seconds) to wait for a response.
+
+        Returns:
+            A `(duration, position)` tuple.
+
+        Raises:
+            TimeoutError: If the request times out.
+        """
+        duration, position = await asyncio.gather(
+            self.get_duration(timeout=timeout),
+            self.get_current_position(timeout=timeout),
         )
+        return duration, position
@@ -0,0 +1,345 @@
+import asyncio
+import base64
+import dataclasses
+import gc
+from types import SimpleNamespace
+
+import flet as ft
+import pytest
+
+import flet_audio as fta
+import flet_audio.audio as audio_module
+
+AUDIO_BYTES = b"\xfb\xff\xfe" * 10
+
+
+def test_src_or_src_base64_required():
+    with pytest.raises(ValueError, match="either src or src_base64"):
+        fta.Audio().before_update()
+
+
+def test_src_base64_standard_alphabet():
+    fta.Audio(src_base64=base64.b64encode(AUDIO_BYTES).decode()).before_update()
+
+
+def test_src_base64_url_safe_alphabet():
+    src_base64 = base64.urlsafe_b64encode(AUDIO_BYTES).decode()
+    assert "-" in src_base64 and "_" in src_base64
+    fta.Audio(src_base64=src_base64).before_update()
+
+
+@pytest.mark.parametrize("src_base64", ["not base64!", "aGVsbG8", "aGVs\nbG8="])
+def test_src_base64_invalid(src_base64):
+    with pytest.raises(ValueError, match="valid base-64"):
+        fta.Audio(src_base64=src_base64).before_update()
+
+
+def position_change(audio: fta.Audio, position: int) -> fta.AudioPositionChangeEvent:
+    return fta.AudioPositionChangeEvent(
+        name="position_change", control=audio, position=position
+    )
+
+
+def deliver_positions(audio: fta.Audio, positions: list[int]) -> list[int]:
+    return [p for p in positions if audio.before_event(position_change(audio, p))]
+
+
+class InvokeMethodStub:
+    """
+    Records `_invoke_method` calls.
+
+    If `block` is set, each call waits until the test releases it.
+    """
+
+    def __init__(self, block: bool):
+        self.block = block
+        self.calls = asyncio.Queue()
+        self.positions = []
+
+    async def __call__(self, method_name, arguments=None, timeout=None):
+        self.positions.append(arguments["position"])
+        call = SimpleNamespace(
+            arguments=arguments, released=asyncio.Event(), error=None
+        )
+        await self.calls.put(call)
+        if self.block:
+            await call.released.wait()
+            if call.error is not None:
+                raise call.error
+
+    async def release_next(self, error: Exception | None = None) -> int:
+        call = await asyncio.wait_for(self.calls.get(), 5)
+        call.error = error
+        call.released.set()
+        return call.arguments["position"]
+
+
+@pytest.fixture
+def invoked(monkeypatch):
+    """Replaces `_invoke_method` of the given audio with an `InvokeMethodStub`."""
+
+    def patch(audio: fta.Audio, block: bool = False) -> InvokeMethodStub:
+        stub = InvokeMethodStub(block)
+        monkeypatch.setattr(audio, "_invoke_method", stub)
+        return stub
+
+    return patch
+
+
+def test_position_change_not_throttled_by_default():
+    audio = fta.Audio(src="a.mp3")
+    assert deliver_positions(audio, [0, 1000, 2000]) == [0, 1000, 2000]
+
+
+def test_position_change_throttled():
+    async def main():
+        audio = fta.Audio(src="a.mp3", position_change_min_interval=2500)
+        return deliver_positions(audio, [0, 1000, 2000, 3000, 4000, 1000])
+
+    assert asyncio.run(main()) == [0, 3000, 1000]
+
+
+def test_position_change_min_interval_duration():
+    async def main():
+        audio = fta.Audio(
+            src="a.mp3", position_change_min_interval=ft.Duration(seconds=2)
+        )
+        return deliver_positions(audio, [0, 1000, 2000])
+
+    assert asyncio.run(main()) == [0, 2000]
+
+
+def test_position_change_after_seek_not_throttled(invoked):
+    async def main():
+        audio = fta.Audio(src="a.mp3", position_change_min_interval=5000)
+        invoked(audio)
+        delivered = deliver_positions(audio, [10000])
+        await audio.seek(13000)
+        delivered += deliver_positions(audio, [13000, 14000])
+        return delivered
+
+    assert asyncio.run(main()) == [10000, 13000]
+
+
+def test_position_change_after_source_change_not_throttled():
+    async def main():
+        audio = fta.Audio(src="a.mp3", position_change_min_interval=5000)
+        audio.before_update()
+        delivered = deliver_positions(audio, [10000])
+        audio.src = "b.mp3"
+        audio.before_update()
+        delivered += deliver_positions(audio, [12000])
+        return delivered
+
+    assert asyncio.run(main()) == [10000, 12000]
+
+
+def test_python_only_properties_not_sent_to_client():
+    skipped = {f.name for f in dataclasses.fields(fta.Audio) if "skip" in f.metadata}
+    assert {"position_change_min_interval", "seek_coalesce"} <= skipped
+
+
+class FakeSession:
+    def __init__(self):
+        self.dispatched = []
+        self.dispatched_event = asyncio.Event()
+
+    async def dispatch_event(self, control_id, event_name, event_data):
+        self.dispatched.append((control_id, event_name, event_data))
+        self.dispatched_event.set()
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Attaches all audios to a fake page with a recording session."""
+    monkeypatch.setattr(audio_module, "_TRAILING_POSITION_CHANGE_DELAY", 0.2)
+
+    def patch():
+        session = FakeSession()
+        page = SimpleNamespace(session=session)
+        monkeypatch.setattr(fta.Audio, "page", property(lambda self: page))
+        return session
+
+    return patch
+
+
+def test_position_change_trailing_event_not_sent_during_playback(session):
+    async def main():
+        fake_session = session()
+        # playback in real time, with a tick every 10 ms of playback
+        audio = fta.Audio(src="a.mp3", position_change_min_interval=25)
+        delivered = []
+        for position in range(0, 80, 10):
+            delivered += deliver_positions(audio, [position])
+            await asyncio.sleep(0.01)
+        assert fake_session.dispatched == []
+
+        # playback stopped reporting positions: the dropped 70 is delivered
+        await asyncio.wait_for(fake_session.dispatched_event.wait(), 5)
+        return audio, delivered, fake_session.dispatched
+
+    audio, delivered, dispatched = asyncio.run(main())
+    assert delivered == [0, 30, 60]
+    assert dispatched == [(audio._i, "position_change", {"position": 70})]
+
+
+def test_position_change_trailing_event_cancelled_on_unmount(session):
+    async def main():
+        fake_session = session()
+        audio = fta.Audio(src="a.mp3", position_change_min_interval=2500)
+        deliver_positions(audio, [0, 1000])
+        audio.will_unmount()
+        await asyncio.sleep(0.4)
+        return fake_session.dispatched
+
+    assert asyncio.run(main()) == []
+
+
+def test_position_change_trailing_event_off_page(monkeypatch):
+    monkeypatch.setattr(audio_module, "_TRAILING_POSITION_CHANGE_DELAY", 0.01)
+
+    async def main():
+        audio = fta.Audio(src="a.mp3", position_change_min_interval=2500)
+        deliver_positions(audio, [0, 1000])
+        loop = asyncio.get_running_loop()
+        errors = []
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        await asyncio.sleep(0.05)
+        return errors
+
+    assert asyncio.run(main()) == []
+
+
+def test_seek_burst_coalesced(invoked):
+    async def main():
+        audio = fta.Audio(src="a.mp3")
+        stub = invoked(audio, block=True)
+        seeks = [asyncio.create_task(audio.seek(p)) for p in range(0, 10000, 1000)]
+        assert await stub.release_next() == 9000
+        await asyncio.gather(*seeks)
+        return stub.positions
+
+    assert asyncio.run(main()) == [9000]
+
+
+def test_seek_during_seek_sends_latest(invoked):
+    async def main():
+        audio = fta.Audio(src="a.mp3")
+        stub = invoked(audio, block=True)
+        first = asyncio.create_task(audio.seek(1000))
+        call = await stub.calls.get()  # first seek is in flight
+        second = asyncio.create_task(audio.seek(2000))
+        third = asyncio.create_task(audio.seek(3000))
+
+        # replaced before being sent: returns without waiting for the first seek
+        await second
+        assert not first.done()
+
+        call.released.set()
+        await first
+        assert not third.done()
+        assert await stub.release_next() == 3000
+        await third
+        return stub.positions
+
+    assert asyncio.run(main()) == [1000, 3000]
+
+
+def test_seek_not_coalesced(invoked):
+    async def main():
+        audio = fta.Audio(src="a.mp3", seek_coalesce=False)
+        stub = invoked(audio)
+        await asyncio.gather(*(audio.seek(p) for p in (1000, 2000, 3000)))
+        return stub.positions
+
+    assert asyncio.run(main()) == [1000, 2000, 3000]
+
+
+def test_seek_caller_cancellation_does_not_abort_seek(invoked):
+    async def main():
+        audio = fta.Audio(src="a.mp3")
+        stub = invoked(audio, block=True)
+        first = asyncio.create_task(audio.seek(1000))
+        call = await stub.calls.get()
+        second = asyncio.create_task(audio.seek(2000))
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        call.released.set()
+        assert await stub.release_next() == 2000
+        await second
+        return stub.positions
+
+    assert asyncio.run(main()) == [1000, 2000]
+
+
+def test_seek_callers_return_during_drag(invoked):
+    async def main():
+        audio = fta.Audio(src="a.mp3")
+        stub = invoked(audio, block=True)
+        first = asyncio.create_task(audio.seek(0))
+        call = await stub.calls.get()
+
+        # a continuous drag: every caller returns once its own position
+        # has been sent or replaced, while the drag is still going on
+        dragged = [asyncio.create_task(audio.seek(p)) for p in range(100, 600, 100)]
+        call.released.set()
+        await first
+        call = await stub.calls.get()
+        assert call.arguments["position"] == 500
+        await asyncio.gather(*dragged[:-1])
+        in_flight = dragged[-1]
+
+        dragged = [asyncio.create_task(audio.seek(p)) for p in range(600, 1000, 100)]
+        await asyncio.gather(*dragged[:-1])
+        assert not in_flight.done()
+        call.released.set()
+        await in_flight
+        assert await stub.release_next() == 900
+        await dragged[-1]
+        return stub.positions
+
+    assert asyncio.run(main()) == [0, 500, 900]
+
+
+def test_seek_timeout(invoked):
+    async def main():
+        audio = fta.Audio(src="a.mp3")
+        stub = invoked(audio, block=True)
+        errors = []
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: errors.append(context)
+        )
+        with pytest.raises(TimeoutError):
+            await audio.seek(1000, timeout=0.01)
+
+        # the request fails after its only caller gave up
+        await stub.release_next(RuntimeError("seek failed"))
+        await asyncio.gather(audio.seek(2000), stub.release_next())
+        gc.collect()
+        return errors, stub.positions
+
+    errors, positions = asyncio.run(main())
+    assert errors == []
+    assert positions == [1000, 2000]
+
+
+def test_seek_failure_fails_only_its_caller(invoked):
+    async def main():
+        audio = fta.Audio(src="a.mp3")
+        stub = invoked(audio, block=True)
+        first = asyncio.create_task(audio.seek(1000))
+        call = await stub.calls.get()
+        second = asyncio.create_task(audio.seek(2000))
+
+        call.error = RuntimeError("seek failed")
+        call.released.set()
+        with pytest.raises(RuntimeError, match="seek failed"):
+            await first
+
+        assert await stub.release_next() == 2000
+        await second
+        return stub.positions
+
+    assert asyncio.run(main()) == [1000, 2000]